@@ -3,204 +3,425 @@ Configuration loader for network devices.
 """
 
 from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import hashlib
 import os
 from pathlib import Path
 import json
+import mmap
 import re
+import socket
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import time; every load re-used these patterns, so keeping
+# them module-level avoids re-parsing the pattern strings on each call.
+_HOSTNAME_RE = re.compile(r'hostname\s+(\S+)')
+_BGP_SECTION_START_RE = re.compile(r'^router bgp\s+\d+[ \t]*\n', re.MULTILINE)
+_BGP_ROUTER_ID_RE = re.compile(r'bgp router-id\s+(\S+)')
+_CISCO_IFACE_RE = re.compile(r'interface\s+(\S+)')
+_CISCO_IP_RE = re.compile(r'ip\s+address\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)')
+_JUNIPER_IFACE_RE = re.compile(
+    r'set\s+interfaces\s+(\S+)\s+unit\s+\d+\s+family\s+inet\s+address\s+(\d+\.\d+\.\d+\.\d+/\d+)'
+)
+_GENERIC_IP_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)(?:/(\d+))?')
+_GENERIC_IFACE_RE = re.compile(r'(?:interface|port|eth)\s*[:=]?\s*(\S+)', re.IGNORECASE)
+
+# Format-detection keyword sets as single alternations, so each vendor
+# check is one C-level scan instead of one substring pass per keyword.
+_CISCO_KEYWORDS_RE = re.compile(r'cisco|ios|interface|ip address|router')
+_JUNIPER_KEYWORDS_RE = re.compile(r'juniper|junos|set|interfaces|routing-options')
+
+# Single alternation covering every line kind the extractors care about.
+# One finditer pass over the whole buffer replaces the per-line split +
+# startswith dispatch previously done separately by each extractor.
+# Interned values that repeat across every parsed interface/device; a
+# large snapshot otherwise carries thousands of duplicate str objects.
+_CISCO = sys.intern('Cisco')
+_UP = sys.intern('up')
+_DOWN = sys.intern('down')
+
+# Files at least this large are memory-mapped instead of read into an
+# intermediate bytes object.
+_MMAP_MIN_SIZE = 1 << 20
+
+# All 33 possible dotted-quad masks, indexed by prefix length.
+_CIDR_MASKS = tuple(
+    socket.inet_ntoa((((0xffffffff << (32 - c)) & 0xffffffff) if c else 0).to_bytes(4, 'big'))
+    for c in range(33)
+)
+
+_TOKEN_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<iface>interface)[ \t]+(?P<iface_name>\S+)'
+    r'|(?P<ip>ip address)[ \t]+(?P<ip_addr>\S+)(?:[ \t]+(?P<ip_mask>\S+))?'
+    r'|(?P<bgp>router bgp)[ \t]+\d+'
+    r'|(?P<neighbor>neighbor)[ \t]+(?P<neighbor_target>\S+)(?P<neighbor_rest>[^\n]*)'
+    r'|(?P<end>!)[ \t]*$'
+    r')',
+    re.MULTILINE
+)
 
 class ConfigLoader:
     """Loads and processes network device configurations."""
-    
+
+    __slots__ = ('configs',)
+
+    # Parsed results keyed by content digest, shared across instances so
+    # re-uploading an unchanged file skips the whole parse.
+    _parse_cache: Dict[bytes, Any] = {}
+
     def __init__(self):
         """Initialize the config loader."""
         self.configs = {}
-    
-    def load_configs(self, file_path: str) -> Dict[str, Any]:
+
+    def load_configs(self, file_path: str, finalize: bool = True) -> Dict[str, Any]:
         """
         Load configuration from a file.
-        
+
         Args:
             file_path: Path to the configuration file
-            
+            finalize: Run neighbor inference after loading; callers that
+                load many files one by one can pass False and call
+                finalize() once at the end instead
+
         Returns:
             Dictionary containing the configuration
         """
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
+        device_name, config = self._load_single(file_path)
+        self.configs[device_name] = config
+
+        # --- IP邻居自动推断 ---
+        # 只有所有设备都加载完后再调用此逻辑（假设多次load_configs后再用self.configs）
+        if finalize:
+            self._infer_ip_neighbors()
+        return self.configs
+
+    def finalize(self) -> Dict[str, Any]:
+        """Run neighbor inference over everything loaded so far."""
+        self._infer_ip_neighbors()
+        return self.configs
+
+    def load_configs_batch(self, file_paths: List[str], max_workers: int = None) -> Dict[str, Any]:
+        """
+        Load several configuration files, parsing them in parallel.
+
+        Args:
+            file_paths: Paths to the configuration files
+            max_workers: Optional worker-process cap
+
+        Returns:
+            Dictionary containing all loaded configurations
+        """
+        if len(file_paths) < 2:
+            for file_path in file_paths:
+                device_name, config = self._load_single(file_path)
+                self.configs[device_name] = config
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                for device_name, config in pool.map(_parse_config_file, file_paths):
+                    self.configs[device_name] = config
+
+        # 所有设备都加载完后只做一次邻居推断
+        self._infer_ip_neighbors()
+        return self.configs
+
+    def parse_text(self, content: str, fallback_name: str = '', finalize: bool = True) -> Dict[str, Any]:
+        """
+        Parse configuration text already held in memory.
+
+        Goes through the same content-digest cache as load_configs, so
+        repeated text is parsed once and never touches the filesystem.
+
+        Args:
+            content: Decoded configuration text
+            fallback_name: Device name to use when the text carries no
+                hostname line
+            finalize: Run neighbor inference after loading, as in
+                load_configs
+
+        Returns:
+            Dictionary containing the configuration
+        """
+        data = content.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        cached = self._parse_cache.get(digest)
+        if cached is None:
+            hostname, config = self._parse_content(content)
+            self._parse_cache[digest] = (hostname, config)
+        else:
+            hostname, config = cached
+
+        config = copy.deepcopy(config)
+        device_name = hostname if hostname else fallback_name
+        self.configs[device_name] = config
+        if finalize:
+            self._infer_ip_neighbors()
+        return self.configs
+
+    def _load_single(self, file_path: str):
+        """Read, hash and parse one file; returns (device_name, config)."""
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _MMAP_MIN_SIZE:
+                # Map large files so hashing (and a cache hit) never copies
+                # the file contents into Python-owned memory.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.blake2b(mm, digest_size=16).digest()
+                    cached = self._parse_cache.get(digest)
+                    if cached is None:
+                        hostname, config = self._parse_content(
+                            str(mm[:], 'utf-8', 'replace')
+                        )
+                        self._parse_cache[digest] = (hostname, config)
+                    else:
+                        hostname, config = cached
+            else:
+                data = f.read()
+                digest = hashlib.blake2b(data, digest_size=16).digest()
+                cached = self._parse_cache.get(digest)
+                if cached is None:
+                    hostname, config = self._parse_content(data.decode('utf-8', 'replace'))
+                    self._parse_cache[digest] = (hostname, config)
+                else:
+                    hostname, config = cached
+
+        # Copy before installing: neighbor inference mutates the dict and
+        # must not bleed into the shared cache entry.
+        config = copy.deepcopy(config)
+        device_name = hostname if hostname else Path(file_path).stem
+        return device_name, config
+
+    def _parse_content(self, content: str):
+        """Parse a decoded configuration into (hostname, config dict)."""
         # Extract device name
-        hostname_match = re.search(r'hostname\s+(\S+)', content)
-        device_name = hostname_match.group(1) if hostname_match else Path(file_path).stem
-        
-        # Extract interfaces
-        interfaces = self._extract_interfaces(content)
-        
-        # Extract BGP neighbors
-        bgp_neighbors = self._extract_bgp_neighbors(content)
-        
+        hostname_match = _HOSTNAME_RE.search(content)
+        hostname = hostname_match.group(1) if hostname_match else ''
+
+        # One shared scan feeds both the interface and BGP extraction.
+        scanned = self._scan_config(content)
+        interfaces = scanned['interfaces']
+        bgp_neighbors = self._resolve_bgp_neighbors(scanned)
+
         # Update interfaces with neighbor information (BGP neighbor IP match)
         for interface in interfaces:
             for neighbor in bgp_neighbors:
                 if interface.get('ip_address') == neighbor.get('ip'):
                     interface['neighbor'] = neighbor
-        
+
         # Build configuration
         config = {
-            'device_type': 'Cisco',
+            'device_type': _CISCO,
             'interfaces': interfaces,
             'bgp': {
                 'router_id': self._extract_bgp_router_id(content),
                 'neighbors': bgp_neighbors
             }
         }
-        
-        self.configs[device_name] = config
-        
-        # --- IP邻居自动推断 ---
-        # 只有所有设备都加载完后再调用此逻辑（假设多次load_configs后再用self.configs）
-        # 这里每次只处理当前设备，但会遍历self.configs中所有设备
-        for this_dev, this_conf in self.configs.items():
-            for iface in this_conf.get('interfaces', []):
-                ip1 = iface.get('ip_address')
-                mask1 = iface.get('subnet_mask')
-                if not ip1 or not mask1:
+        return hostname, config
+
+    def _infer_ip_neighbors(self) -> None:
+        """
+        Infer point-to-point neighbors across loaded devices.
+
+        Interfaces are bucketed by (mask, network) so candidates are joined
+        via hash lookup instead of comparing every interface pair across
+        every device pair.
+        """
+        # Columnar layout: the join only touches these parallel arrays, so
+        # the interface dicts themselves are left alone until a pair links.
+        devs: List[str] = []
+        ifaces: List[Dict[str, Any]] = []
+        keys: List[Any] = []
+        for dev, conf in self.configs.items():
+            for iface in conf.get('interfaces', []):
+                ip = iface.get('ip_address')
+                mask = iface.get('subnet_mask')
+                if not ip or not mask:
                     continue
-                # 跳过已有neighbor的接口（如BGP或手动指定）
-                if iface.get('neighbor') and iface['neighbor']:
+                key = self._net_key(ip, mask)
+                if key is None:
                     continue
-                for other_dev, other_conf in self.configs.items():
-                    if other_dev == this_dev:
+                devs.append(dev)
+                ifaces.append(iface)
+                keys.append(key)
+
+        buckets: Dict[Any, List[int]] = {}
+        for idx, key in enumerate(keys):
+            buckets.setdefault(key, []).append(idx)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if devs[i] == devs[j]:
                         continue
-                    for oiface in other_conf.get('interfaces', []):
-                        ip2 = oiface.get('ip_address')
-                        mask2 = oiface.get('subnet_mask')
-                        if not ip2 or not mask2:
-                            continue
-                        if self._is_same_subnet(ip1, mask1, ip2, mask2):
-                            # 互为neighbor
-                            iface['neighbor'] = {
-                                'device': other_dev,
-                                'interface': oiface.get('name', ''),
-                                'ip_address': ip2
-                            }
-                            # 对端也加上neighbor（如果还没有）
-                            if not oiface.get('neighbor'):
-                                oiface['neighbor'] = {
-                                    'device': this_dev,
-                                    'interface': iface.get('name', ''),
-                                    'ip_address': ip1
-                                }
-        return self.configs
+                    iface1 = ifaces[i]
+                    iface2 = ifaces[j]
+                    # 互为neighbor（已有neighbor的接口不覆盖，如BGP或手动指定）
+                    if not iface1.get('neighbor'):
+                        iface1['neighbor'] = {
+                            'device': devs[j],
+                            'interface': iface2.get('name', ''),
+                            'ip_address': iface2.get('ip_address')
+                        }
+                    if not iface2.get('neighbor'):
+                        iface2['neighbor'] = {
+                            'device': devs[i],
+                            'interface': iface1.get('name', ''),
+                            'ip_address': iface1.get('ip_address')
+                        }
+
+    def _net_key(self, ip: str, mask: str):
+        """Return the (mask, network) integer pair for an interface address."""
+        try:
+            mask_int = int.from_bytes(socket.inet_aton(mask), 'big')
+            ip_int = int.from_bytes(socket.inet_aton(ip), 'big')
+        except OSError:
+            return None
+        return mask_int, ip_int & mask_int
     
-    def _extract_interfaces(self, content: str) -> List[Dict[str, Any]]:
-        """Extract interface information from configuration."""
+    def _scan_config(self, content: str) -> Dict[str, Any]:
+        """
+        Tokenize a configuration in a single pass over the buffer.
+
+        Returns a dictionary with the extracted 'interfaces' and the raw
+        'bgp_neighbors' stubs found in the BGP section.
+        """
         interfaces = []
+        bgp_neighbors = []
         current_interface = None
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            
+        in_bgp_section = False
+
+        for match in _TOKEN_RE.finditer(content):
             # Start of interface configuration
-            if line.startswith('interface'):
+            if match.group('iface'):
                 if current_interface:
                     interfaces.append(current_interface)
                 current_interface = {
-                    'name': line.split()[1],
+                    'name': sys.intern(match.group('iface_name')),
                     'ip_address': '',
                     'subnet_mask': '',
                     'neighbor': {},
-                    'status': 'down'
+                    'status': _DOWN
                 }
-            
+
             # Interface IP address
-            elif current_interface and line.startswith('ip address'):
-                parts = line.split()
-                if len(parts) >= 4:
-                    # 标准写法 ip address <ip> <mask>
-                    current_interface['ip_address'] = parts[2]
-                    current_interface['subnet_mask'] = parts[3]
-                    current_interface['status'] = 'up'
-                elif len(parts) == 3 and '/' in parts[2]:
-                    # 支持 ip address <ip>/<prefix>
-                    ip, prefix = parts[2].split('/')
-                    current_interface['ip_address'] = ip
-                    current_interface['subnet_mask'] = self._cidr_to_mask(int(prefix))
-                    current_interface['status'] = 'up'
-            
-            # BGP neighbor configuration
-            elif current_interface and line.startswith('neighbor'):
-                parts = line.split()
-                if len(parts) >= 2:
+            elif match.group('ip'):
+                if current_interface:
+                    ip_addr = match.group('ip_addr')
+                    ip_mask = match.group('ip_mask')
+                    if ip_mask:
+                        # 标准写法 ip address <ip> <mask>
+                        current_interface['ip_address'] = ip_addr
+                        current_interface['subnet_mask'] = sys.intern(ip_mask)
+                        current_interface['status'] = _UP
+                    elif '/' in ip_addr:
+                        # 支持 ip address <ip>/<prefix>
+                        ip, prefix = ip_addr.split('/')
+                        current_interface['ip_address'] = ip
+                        current_interface['subnet_mask'] = self._cidr_to_mask(int(prefix))
+                        current_interface['status'] = _UP
+
+            # Start of BGP configuration
+            elif match.group('bgp'):
+                in_bgp_section = True
+
+            # Neighbor line (interface context or BGP section)
+            elif match.group('neighbor'):
+                target = match.group('neighbor_target')
+                if current_interface:
                     current_interface['neighbor'] = {
-                        'device': parts[1],
-                        'interface': parts[1].split('.')[-1] if '.' in parts[1] else ''
+                        'device': target,
+                        'interface': target.split('.')[-1] if '.' in target else ''
                     }
-            
-            # End of interface configuration
-            elif line == '!' and current_interface:
-                interfaces.append(current_interface)
-                current_interface = None
-        
+                elif in_bgp_section:
+                    bgp_neighbors.append({
+                        'ip': target,
+                        'as': '',
+                        'interface': '',
+                        'rest': match.group('neighbor_rest')
+                    })
+
+            # End of a configuration block
+            elif match.group('end'):
+                if current_interface:
+                    interfaces.append(current_interface)
+                    current_interface = None
+                in_bgp_section = False
+
         # Add the last interface if exists
         if current_interface:
             interfaces.append(current_interface)
-        
-        return interfaces
-    
+
+        return {'interfaces': interfaces, 'bgp_neighbors': bgp_neighbors}
+
+    def _extract_interfaces(self, content: str) -> List[Dict[str, Any]]:
+        """Extract interface information from configuration."""
+        return self._scan_config(content)['interfaces']
+
     def _extract_bgp_neighbors(self, content: str) -> List[Dict[str, Any]]:
         """Extract BGP neighbor information from configuration."""
+        return self._resolve_bgp_neighbors(self._scan_config(content))
+
+    def _resolve_bgp_neighbors(self, scanned: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Resolve AS numbers and local interfaces for scanned BGP stubs."""
+        stubs = scanned['bgp_neighbors']
+
+        # Index remote-as, peer-group and interface lookups once instead of
+        # rescanning the whole buffer for every neighbor.
+        remote_as_by_peer = {}
+        peer_group_of = {}
+        for stub in stubs:
+            rest = stub['rest']
+            if 'remote-as' in rest and stub['ip'] not in remote_as_by_peer:
+                remote_as_by_peer[stub['ip']] = rest.split('remote-as')[1].strip()
+            elif 'peer-group' in rest:
+                parts = rest.split()
+                if len(parts) == 2 and parts[0] == 'peer-group':
+                    peer_group_of[stub['ip']] = parts[1]
+        iface_by_ip = {
+            interface['ip_address']: interface['name']
+            for interface in scanned['interfaces']
+            if interface['ip_address']
+        }
+
         neighbors = []
-        in_bgp_section = False
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            
-            # Start of BGP configuration
-            if line.startswith('router bgp'):
-                in_bgp_section = True
-                continue
-            
-            # End of BGP configuration
-            elif line == '!' and in_bgp_section:
-                in_bgp_section = False
-                continue
-            
-            # BGP neighbor configuration
-            elif in_bgp_section and line.startswith('neighbor'):
-                parts = line.split()
-                if len(parts) >= 2:
-                    neighbor = {
-                        'ip': parts[1],
-                        'as': '',
-                        'interface': ''
-                    }
-                    
-                    # Look for AS number
-                    for next_line in content.split('\n'):
-                        if f'neighbor {neighbor["ip"]}' in next_line and 'remote-as' in next_line:
-                            neighbor['as'] = next_line.split('remote-as')[1].strip()
-                            break
-                    
-                    # Find interface with matching IP
-                    for interface in self._extract_interfaces(content):
-                        if interface['ip_address'] == neighbor['ip']:
-                            neighbor['interface'] = interface['name']
-                            break
-                    
-                    neighbors.append(neighbor)
-        
+        for stub in stubs:
+            ip = stub['ip']
+            # Neighbors configured through a peer group inherit its AS.
+            remote_as = remote_as_by_peer.get(ip, '')
+            if not remote_as and ip in peer_group_of:
+                remote_as = remote_as_by_peer.get(peer_group_of[ip], '')
+            neighbors.append({
+                'ip': ip,
+                'as': remote_as,
+                'interface': iface_by_ip.get(ip, '')
+            })
         return neighbors
     
     def _extract_bgp_section(self, content: str) -> str:
         """Extract the BGP configuration section."""
-        bgp_pattern = r'router bgp\s+\d+\s*\n(.*?)(?=^!|\Z)'
-        match = re.search(bgp_pattern, content, re.MULTILINE | re.DOTALL)
-        return match.group(1) if match else ''
+        match = _BGP_SECTION_START_RE.search(content)
+        if not match:
+            return ''
+        start = match.end()
+        # Find the terminating '!' line with plain string searches instead
+        # of a lazy .*? scan that backtracks per character.
+        if content.startswith('!', start):
+            return ''
+        end = content.find('\n!', start)
+        return content[start:end + 1] if end != -1 else content[start:]
     
     def _extract_bgp_router_id(self, content: str) -> str:
         """Extract BGP router ID from configuration."""
-        router_id_pattern = r'bgp router-id\s+(\S+)'
-        match = re.search(router_id_pattern, content)
+        match = _BGP_ROUTER_ID_RE.search(content)
         return match.group(1) if match else ''
     
     def create_snapshot(self, configs: Dict[str, Any], snapshot_name: str) -> str:
@@ -218,40 +439,53 @@ class ConfigLoader:
         snapshot_dir.mkdir(exist_ok=True)
         
         snapshot_path = snapshot_dir / f'{snapshot_name}.json'
-        with open(snapshot_path, 'w') as f:
-            json.dump(configs, f, indent=2)
-        
+        if orjson is not None:
+            # Single C-level encode + one write call, no per-chunk
+            # str encoding like json.dump's streaming path.
+            payload = orjson.dumps(configs, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(configs, indent=2).encode('utf-8')
+
+        # Skip the write entirely when the snapshot is byte-identical, so
+        # mtime-based consumers don't see a phantom change.
+        if snapshot_path.exists():
+            new_digest = hashlib.blake2b(payload, digest_size=16).digest()
+            old_digest = hashlib.blake2b(snapshot_path.read_bytes(), digest_size=16).digest()
+            if new_digest == old_digest:
+                return str(snapshot_path)
+
+        tmp_path = snapshot_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(snapshot_path)
+
         return str(snapshot_path)
     
     def _detect_config_format(self, content: str) -> str:
         """Detect the format of the configuration file."""
         content = content.lower()
-        
+
         # Cisco IOS format detection
-        if any(keyword in content for keyword in ['cisco', 'ios', 'interface', 'ip address', 'router']):
+        if _CISCO_KEYWORDS_RE.search(content):
             return 'Cisco'
-        
+
         # Juniper Junos format detection
-        if any(keyword in content for keyword in ['juniper', 'junos', 'set', 'interfaces', 'routing-options']):
+        if _JUNIPER_KEYWORDS_RE.search(content):
             return 'Juniper'
-        
+
         return 'Generic'
     
     def _parse_cisco_config(self, content: str) -> Dict[str, Any]:
         """Parse Cisco IOS configuration."""
         config = {
-            'device_type': 'Cisco',
+            'device_type': _CISCO,
             'interfaces': [],
             'raw_config': content
         }
         
         # Parse interfaces
-        interface_pattern = r'interface\s+(\S+)'
-        ip_pattern = r'ip\s+address\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+\.\d+\.\d+\.\d+)'
-        
         current_interface = None
         for line in content.split('\n'):
-            interface_match = re.match(interface_pattern, line.strip())
+            interface_match = _CISCO_IFACE_RE.match(line.strip())
             if interface_match:
                 current_interface = {
                     'name': interface_match.group(1),
@@ -260,7 +494,7 @@ class ConfigLoader:
                 }
                 config['interfaces'].append(current_interface)
             elif current_interface:
-                ip_match = re.match(ip_pattern, line.strip())
+                ip_match = _CISCO_IP_RE.match(line.strip())
                 if ip_match:
                     current_interface['ip_address'] = ip_match.group(1)
                     current_interface['subnet_mask'] = ip_match.group(2)
@@ -276,10 +510,8 @@ class ConfigLoader:
         }
         
         # Parse interfaces
-        interface_pattern = r'set\s+interfaces\s+(\S+)\s+unit\s+\d+\s+family\s+inet\s+address\s+(\d+\.\d+\.\d+\.\d+/\d+)'
-        
         for line in content.split('\n'):
-            match = re.match(interface_pattern, line.strip())
+            match = _JUNIPER_IFACE_RE.match(line.strip())
             if match:
                 interface_name = match.group(1)
                 ip_address = match.group(2).split('/')[0]
@@ -302,12 +534,9 @@ class ConfigLoader:
         }
         
         # Try to find IP addresses and interfaces
-        ip_pattern = r'(\d+\.\d+\.\d+\.\d+)(?:/(\d+))?'
-        interface_pattern = r'(?:interface|port|eth)\s*[:=]?\s*(\S+)'
-        
         for line in content.split('\n'):
             # Look for interfaces
-            interface_match = re.search(interface_pattern, line, re.IGNORECASE)
+            interface_match = _GENERIC_IFACE_RE.search(line)
             if interface_match:
                 interface = {
                     'name': interface_match.group(1),
@@ -328,18 +557,20 @@ class ConfigLoader:
     
     def _cidr_to_mask(self, cidr: int) -> str:
         """Convert CIDR notation to subnet mask."""
-        mask = (0xffffffff >> (32 - cidr)) << (32 - cidr)
-        return f"{(mask >> 24) & 0xff}.{(mask >> 16) & 0xff}.{(mask >> 8) & 0xff}.{mask & 0xff}"
+        return _CIDR_MASKS[cidr]
     
     def _is_same_subnet(self, ip1: str, mask1: str, ip2: str, mask2: str) -> bool:
         """Check if two IP addresses are in the same subnet."""
         try:
-            ip1_parts = [int(x) for x in ip1.split('.')]
-            mask1_parts = [int(x) for x in mask1.split('.')]
-            ip2_parts = [int(x) for x in ip2.split('.')]
-            mask2_parts = [int(x) for x in mask2.split('.')]
-            net1 = [ip1_parts[i] & mask1_parts[i] for i in range(4)]
-            net2 = [ip2_parts[i] & mask2_parts[i] for i in range(4)]
+            net1 = (int.from_bytes(socket.inet_aton(ip1), 'big')
+                    & int.from_bytes(socket.inet_aton(mask1), 'big'))
+            net2 = (int.from_bytes(socket.inet_aton(ip2), 'big')
+                    & int.from_bytes(socket.inet_aton(mask2), 'big'))
             return net1 == net2
-        except:
-            return False 
\ No newline at end of file
+        except OSError:
+            return False
+
+
+def _parse_config_file(file_path: str):
+    """Module-level worker so batch parsing can run in a process pool."""
+    return ConfigLoader()._load_single(file_path)
\ No newline at end of file
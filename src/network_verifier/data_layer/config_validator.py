@@ -3,67 +3,89 @@ Configuration validator for network device configurations.
 """
 
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from batfish.client.session import Session
-from batfish.datamodel import *
-from ..config import settings
+from batfish.datamodel import NodeSpecifier
+from ..config import get_settings
 
 class ConfigValidator:
     """Validates network configuration files and their contents."""
-    
+
     def __init__(self):
+        settings = get_settings()
         self.session = Session(
             host=settings.batfish_host,
             port=settings.batfish_port
         )
-    
+        # Futures keyed by (snapshot_name, check name); caching the future
+        # rather than the result lets concurrent callers share one
+        # in-flight Batfish query.
+        self._answer_cache = {}
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
     def validate_snapshot(self, snapshot_name: str) -> Dict:
         """
         Validate a network snapshot using Batfish.
-        
+
         Args:
             snapshot_name: Name of the snapshot to validate
-            
+
         Returns:
             Dictionary containing validation results
         """
         self.session.set_snapshot(snapshot_name)
-        
-        validation_results = {
-            'parse_warnings': self._check_parse_warnings(),
-            'reference_check': self._check_references(),
-            'undefined_references': self._check_undefined_references(),
-            'unused_structures': self._check_unused_structures()
+
+        # Each check blocks on a Batfish round-trip, so run the four
+        # queries concurrently and reuse cached answers per snapshot.
+        futures = {
+            name: self._submit_check(snapshot_name, name, check)
+            for name, check in (
+                ('parse_warnings', self._check_parse_warnings),
+                ('reference_check', self._check_references),
+                ('undefined_references', self._check_undefined_references),
+                ('unused_structures', self._check_unused_structures),
+            )
         }
-        
-        return validation_results
+
+        return {name: future.result() for name, future in futures.items()}
+
+    def _submit_check(self, snapshot_name: str, check_name: str, check):
+        """Return the cached future for a check, submitting it on first use."""
+        key = (snapshot_name, check_name)
+        future = self._answer_cache.get(key)
+        if future is None:
+            future = self._executor.submit(check)
+            self._answer_cache[key] = future
+        return future
     
+    def _answer_rows(self, question) -> List[Dict]:
+        """
+        Collect answer rows without materializing a pandas DataFrame.
+
+        The raw answer already carries its rows as dicts; only fall back
+        to the frame conversion on clients that do not expose them.
+        """
+        answer = question.answer()
+        try:
+            return list(answer.rows)
+        except AttributeError:
+            return answer.frame().to_dict('records')
+
     def _check_parse_warnings(self) -> List[Dict]:
         """Check for parse warnings in the configuration."""
-        parse_warnings = self.session.q.parseWarning(
-            nodes=NodeSpecifier()
-        ).answer().frame()
-        return parse_warnings.to_dict('records')
-    
+        return self._answer_rows(self.session.q.parseWarning(nodes=NodeSpecifier()))
+
     def _check_references(self) -> List[Dict]:
         """Check for reference issues in the configuration."""
-        references = self.session.q.referenceCheck(
-            nodes=NodeSpecifier()
-        ).answer().frame()
-        return references.to_dict('records')
-    
+        return self._answer_rows(self.session.q.referenceCheck(nodes=NodeSpecifier()))
+
     def _check_undefined_references(self) -> List[Dict]:
         """Check for undefined references in the configuration."""
-        undefined = self.session.q.undefinedReferences(
-            nodes=NodeSpecifier()
-        ).answer().frame()
-        return undefined.to_dict('records')
-    
+        return self._answer_rows(self.session.q.undefinedReferences(nodes=NodeSpecifier()))
+
     def _check_unused_structures(self) -> List[Dict]:
         """Check for unused structures in the configuration."""
-        unused = self.session.q.unusedStructures(
-            nodes=NodeSpecifier()
-        ).answer().frame()
-        return unused.to_dict('records')
+        return self._answer_rows(self.session.q.unusedStructures(nodes=NodeSpecifier()))
     
     def validate_config_elements(self, config_elements: Dict) -> Dict:
         """
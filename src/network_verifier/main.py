@@ -2,15 +2,21 @@
 Main FastAPI application for the Network Verifier system.
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Body
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Body, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+import jinja2
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+import asyncio
+from contextlib import asynccontextmanager
 import os
 from pathlib import Path
 import json
+import aiofiles
 from datetime import datetime
+from functools import lru_cache
 import logging
 from typing import Dict, List, Optional
 from .data_layer.config_loader import ConfigLoader
@@ -19,6 +25,11 @@ from .presentation_layer.report_generator import ReportGenerator
 from .model_layer.topology_builder import TopologyBuilder
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,7 +37,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Network Verifier")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """One-time startup: working directories and a primed snapshot index."""
+    Path("configs").mkdir(exist_ok=True)
+    Path("snapshots").mkdir(exist_ok=True)
+    Path("reports").mkdir(exist_ok=True)
+    # Prime the index so the first request never pays the rebuild scan;
+    # engines and topologies are memoized per snapshot in _engine_for /
+    # _topology_for rather than built per request.
+    async with _index_lock:
+        _load_index()
+    yield
+
+app = FastAPI(title="Network Verifier", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -37,17 +61,197 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Topology payloads are large and highly repetitive JSON; gzip anything
+# beyond a couple of KB (level 5 trades a little ratio for much less CPU)
+app.add_middleware(GZipMiddleware, minimum_size=2048, compresslevel=5)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Templates
-templates = Jinja2Templates(directory="templates")
+# Templates: compile once up front (no per-render mtime checks or
+# recompiles) and persist bytecode so restarts skip the parse as well
+_jinja_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+for _name in _jinja_env.list_templates(extensions=("html",)):
+    _jinja_env.get_template(_name)
+templates = Jinja2Templates(env=_jinja_env)
+
+def _read_json(path) -> Dict:
+    """Parse a JSON file, preferring orjson's C decoder."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _dumps(data) -> bytes:
+    """Encode data as compact JSON bytes.
+
+    Output is compact: snapshots and the index are machine-consumed, and
+    pretty-printing roughly doubles both the bytes written and the time
+    every later reader spends parsing them.
+    """
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+
+def _write_json(path, data) -> None:
+    """Serialize data to a JSON file, preferring orjson's C encoder."""
+    with open(path, "wb") as f:
+        f.write(_dumps(data))
+
+# Snapshot metadata manifest: one in-memory list of {id, timestamp, files}
+# entries in creation order, persisted to snapshots/_index.json so listing
+# and batch lookups never have to open every snapshot file.
+_index_path = Path("snapshots/_index.json")
+_index_lock = asyncio.Lock()
+_snapshot_index: Optional[List[Dict]] = None
+
+def _load_index() -> List[Dict]:
+    """Return the snapshot index, rebuilding it from disk if missing."""
+    global _snapshot_index
+    if _snapshot_index is None:
+        if _index_path.exists():
+            _snapshot_index = _read_json(_index_path)
+        else:
+            _snapshot_index = _rebuild_index()
+            _save_index()
+    return _snapshot_index
+
+def _list_snapshot_entries() -> List[os.DirEntry]:
+    """Snapshot dir entries sorted by mtime.
+
+    os.scandir hands back DirEntry objects whose stat() reuses the inode
+    data fetched during the directory read, so this costs one syscall
+    per directory rather than one per file.
+    """
+    with os.scandir("snapshots") as it:
+        entries = [
+            e for e in it
+            if e.name.startswith("snapshot_") and e.name.endswith(".json")
+        ]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return entries
+
+def _rebuild_index() -> List[Dict]:
+    """Rebuild index entries by scanning the snapshots directory once."""
+    entries = []
+    for snap in _list_snapshot_entries():
+        data = _read_json(snap.path)
+        entries.append({
+            "id": snap.name[:-len(".json")],
+            "timestamp": data.get("timestamp", ""),
+            "files": data.get("files", [])
+        })
+    return entries
+
+def _save_index() -> None:
+    """Persist the index atomically (temp file + rename)."""
+    tmp_path = _index_path.with_name(_index_path.name + ".tmp")
+    _write_json(tmp_path, _snapshot_index)
+    os.replace(tmp_path, _index_path)
+
+# Parsed latest snapshot keyed by (path, mtime); verification endpoints
+# hit this on every call while the snapshot itself changes rarely.
+_latest_cache = {"path": None, "mtime": None, "data": None}
+
+def _latest_snapshot_path() -> Optional[str]:
+    """Newest snapshot file via one O(N) scan — max, not a full sort."""
+    with os.scandir("snapshots") as it:
+        latest = max(
+            (e for e in it if e.name.startswith("snapshot_") and e.name.endswith(".json")),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    return latest.path if latest is not None else None
+
+def _load_latest_snapshot() -> Dict:
+    """Return the parsed latest snapshot, re-reading it only when it changed."""
+    index = _load_index()
+    latest_path = str(Path("snapshots") / f"{index[-1]['id']}.json") if index else None
+    if latest_path is None or not os.path.exists(latest_path):
+        # The index can go stale after out-of-band deletes; fall back to
+        # scanning the directory once
+        latest_path = _latest_snapshot_path()
+    if latest_path is None:
+        raise HTTPException(status_code=404, detail="No network configuration found")
+    latest_mtime = os.stat(latest_path).st_mtime
+    if _latest_cache["path"] != latest_path or _latest_cache["mtime"] != latest_mtime:
+        _latest_cache.update(path=latest_path, mtime=latest_mtime, data=_read_json(latest_path))
+    return _latest_cache["data"]
 
-# Create necessary directories
-Path("configs").mkdir(exist_ok=True)
-Path("snapshots").mkdir(exist_ok=True)
-Path("reports").mkdir(exist_ok=True)
+def _invalidate_latest_snapshot():
+    """Drop the cached snapshot after writes or deletes."""
+    _latest_cache.update(path=None, mtime=None, data=None)
 
+# Topology build and engine setup are pure functions of the snapshot
+# content, so memoize them per (snapshot_id, mtime); a rewritten snapshot
+# gets a fresh mtime and therefore a fresh entry.
+@lru_cache(maxsize=32)
+def _topology_for(snapshot_id: str, mtime: float) -> Dict:
+    """Build and retain the topology for a snapshot."""
+    snapshot_data = _read_json(Path("snapshots") / f"{snapshot_id}.json")
+    return TopologyBuilder().build_topology(snapshot_data.get("configs", {}))
+
+@lru_cache(maxsize=32)
+def _engine_for(snapshot_id: str, mtime: float) -> VerificationEngine:
+    """Return the verification engine reused for a snapshot's queries."""
+    return VerificationEngine(use_batfish=False)
+
+def _latest_engine() -> VerificationEngine:
+    """Engine for the latest snapshot (loads it to resolve id and mtime)."""
+    _load_latest_snapshot()
+    return _engine_for(Path(_latest_cache["path"]).stem, _latest_cache["mtime"])
+
+def _format_topology(topology: Dict) -> Dict:
+    """Project topology nodes/edges down to the fields vis.js renders."""
+    return {
+        "nodes": [
+            {
+                "id": node["id"],
+                "label": node["label"],
+                "title": node["title"],
+                "group": node["group"],
+                "value": node["value"]
+            }
+            for node in topology["nodes"]
+        ],
+        "edges": [
+            {
+                "id": edge["id"],
+                "from": edge["from"],
+                "to": edge["to"],
+                "label": edge["label"],
+                "title": edge["title"]
+            }
+            for edge in topology["edges"]
+        ]
+    }
+
+@lru_cache(maxsize=32)
+def _load_snapshot_payload(snapshot_id: str, mtime: float) -> bytes:
+    """Pre-serialized /load-snapshot response body for a snapshot."""
+    payload = {
+        "status": "success",
+        "topology": _format_topology(_topology_for(snapshot_id, mtime))
+    }
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+def _drop_snapshot_caches() -> None:
+    """Forget memoized topologies and engines after snapshot deletes."""
+    _topology_for.cache_clear()
+    _engine_for.cache_clear()
+    _load_snapshot_payload.cache_clear()
+
+# Request bodies for the verification endpoints. These stay pydantic on
+# purpose: v2 validates through compiled pydantic-core, the bodies are a
+# handful of short strings, and bypassing validation (model_construct or
+# a raw-body decode) would silently turn malformed input into 500s
+# instead of 422s for a decode saving that doesn't show up next to the
+# graph work behind these endpoints.
 class ReachabilityRequest(BaseModel):
     source: str
     target: str
@@ -87,89 +291,133 @@ async def upload_config(files: List[UploadFile] = File(..., description="Multipl
         configs = {}
         saved_files = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Process each uploaded file
+
+        # Validate all extensions up front so no task starts on a bad batch
         for file in files:
-            logger.info(f"Processing file: {file.filename}")
-            
             if not file.filename.endswith(('.cfg', '.txt')):
                 logger.error(f"Invalid file type: {file.filename}")
                 raise HTTPException(
                     status_code=400,
                     detail=f"Invalid file type: {file.filename}. Only .cfg and .txt files are allowed."
                 )
-                
-            # Save uploaded file
+
+        async def save_and_parse(file: UploadFile):
+            """Save one upload and parse it off the event loop."""
+            logger.info(f"Processing file: {file.filename}")
+
+            # Save uploaded file in fixed-size chunks so large configs never
+            # sit fully in memory
             file_path = f"configs/{timestamp}_{file.filename}"
-            with open(file_path, "wb") as f:
-                content = await file.read()
-                f.write(content)
+            async with aiofiles.open(file_path, "wb") as f:
+                while chunk := await file.read(1024 * 1024):
+                    await f.write(chunk)
             logger.info(f"Saved uploaded file to: {file_path}")
-            
-            saved_files.append(file_path)
-            
-            # Load configuration
+
+            # Load configuration (blocking parse, so run it in a thread)
             loader = ConfigLoader()
-            file_configs = loader.load_configs(str(file_path))
-            configs.update(file_configs)
+            file_configs = await asyncio.to_thread(loader.load_configs, file_path)
             logger.info(f"Loaded configurations from: {file.filename}")
+            return file_path, file_configs
+
+        # Files are independent; save and parse them concurrently
+        results = await asyncio.gather(*(save_and_parse(file) for file in files))
+        for file_path, file_configs in results:
+            saved_files.append(file_path)
+            configs.update(file_configs)
         
         if not configs:
             logger.error("No valid configurations were found")
             raise HTTPException(status_code=400, detail="No valid configurations were found in the uploaded files")
         
-        # Create snapshot with saved file paths
-        snapshot_path = f"snapshots/snapshot_{timestamp}.json"
-        snapshot_data = {
-            "timestamp": timestamp,
-            "files": saved_files,
-            "configs": configs
-        }
-        with open(snapshot_path, "w") as f:
-            json.dump(snapshot_data, f, indent=2)
-        logger.info(f"Created snapshot at: {snapshot_path}")
+        return await _finalize_upload(timestamp, saved_files, configs)
         
-        # Build topology
-        topology_builder = TopologyBuilder()
-        topology = topology_builder.build_topology(configs)
-        logger.info("Built network topology")
+    except HTTPException as e:
+        logger.error(f"HTTP Exception: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Error handling upload: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _finalize_upload(timestamp: str, saved_files: List[str], configs: Dict) -> Response:
+    """Write the snapshot, update the index and answer with the topology."""
+    # Create snapshot with saved file paths
+    snapshot_path = f"snapshots/snapshot_{timestamp}.json"
+    snapshot_data = {
+        "timestamp": timestamp,
+        "files": saved_files,
+        "configs": configs
+    }
+    # Write the snapshot without blocking the event loop
+    async with aiofiles.open(snapshot_path, "wb") as f:
+        await f.write(_dumps(snapshot_data))
+    async with _index_lock:
+        index = _load_index()
+        # A lazy rebuild may already have picked up the file just written
+        if not any(e["id"] == f"snapshot_{timestamp}" for e in index):
+            index.append({
+                "id": f"snapshot_{timestamp}",
+                "timestamp": timestamp,
+                "files": saved_files
+            })
+        _save_index()
+    _invalidate_latest_snapshot()
+    logger.info(f"Created snapshot at: {snapshot_path}")
+    
+    # Build topology (CPU-bound, so keep it off the event loop)
+    topology_builder = TopologyBuilder()
+    topology = await asyncio.to_thread(topology_builder.build_topology, configs)
+    logger.info("Built network topology")
+    
+    # Format topology data for vis.js
+    formatted_topology = _format_topology(topology)
+    
+    logger.info("Sending response with topology data")
+    # Encode once with orjson and return the bytes directly; this skips
+    # both FastAPI's jsonable_encoder pass and the stdlib serializer
+    return Response(_dumps({
+        "status": "success",
+        "message": "Configurations uploaded successfully",
+        "topology": formatted_topology
+    }), media_type="application/json")
+
+@app.post("/upload-stream")
+async def upload_stream(request: Request):
+    """Fast path for one large file: raw body streamed straight to disk.
+
+    Skips the multipart parser and its temp-file spool entirely; the
+    client sends the body as-is with the name in an X-Filename header.
+    Intended for CI-driven bulk ingest of big config bundles.
+    """
+    try:
+        filename = request.headers.get("x-filename")
+        if not filename:
+            raise HTTPException(status_code=400, detail="Missing X-Filename header")
+        filename = os.path.basename(filename)
+        if not filename.endswith(('.cfg', '.txt')):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid file type: {filename}. Only .cfg and .txt files are allowed."
+            )
         
-        # Format topology data for vis.js
-        formatted_topology = {
-            "nodes": [
-                {
-                    "id": node["id"],
-                    "label": node["label"],
-                    "title": node["title"],
-                    "group": node["group"],
-                    "value": node["value"]
-                }
-                for node in topology["nodes"]
-            ],
-            "edges": [
-                {
-                    "id": edge["id"],
-                    "from": edge["from"],
-                    "to": edge["to"],
-                    "label": edge["label"],
-                    "title": edge["title"]
-                }
-                for edge in topology["edges"]
-            ]
-        }
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = f"configs/{timestamp}_{filename}"
+        async with aiofiles.open(file_path, "wb") as f:
+            async for chunk in request.stream():
+                await f.write(chunk)
+        logger.info(f"Streamed uploaded file to: {file_path}")
         
-        logger.info("Sending response with topology data")
-        return JSONResponse({
-            "status": "success",
-            "message": "Configurations uploaded successfully",
-            "topology": formatted_topology
-        })
+        loader = ConfigLoader()
+        configs = await asyncio.to_thread(loader.load_configs, file_path)
+        if not configs:
+            raise HTTPException(status_code=400, detail="No valid configurations were found in the uploaded file")
+        
+        return await _finalize_upload(timestamp, [file_path], configs)
         
     except HTTPException as e:
         logger.error(f"HTTP Exception: {str(e)}")
         raise e
     except Exception as e:
-        logger.error(f"Error handling upload: {str(e)}")
+        logger.error(f"Error handling streamed upload: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/reports/{report_name}")
@@ -183,8 +431,9 @@ async def get_report(report_name: str):
                 detail="Report not found"
             )
         
-        with open(report_path, "r") as f:
-            return json.load(f)
+        # Stream the stored bytes directly; the report is already JSON on
+        # disk so there is nothing to parse server-side
+        return FileResponse(report_path, media_type="application/json")
             
     except Exception as e:
         raise HTTPException(
@@ -208,15 +457,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.post("/verify-reachability")
 async def verify_reachability(request: ReachabilityRequest):
     try:
-        # Get the latest snapshot
-        snapshot_dir = Path("snapshots")
-        snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-        if not snapshots:
-            raise HTTPException(status_code=404, detail="No network configuration found")
-        
-        latest_snapshot = snapshots[-1]
-        with open(latest_snapshot, "r") as f:
-            snapshot_data = json.load(f)
+        snapshot_data = _load_latest_snapshot()
         
         # Get configuration files from snapshot
         config_files = snapshot_data.get("files", [])
@@ -224,13 +465,13 @@ async def verify_reachability(request: ReachabilityRequest):
             raise HTTPException(status_code=404, detail="No configuration files found in snapshot")
         
         # Initialize verification engine
-        verification_engine = VerificationEngine(use_batfish=False)
+        verification_engine = _latest_engine()
         
         # Verify reachability
         result = verification_engine.verify_reachability(
             request.source,
             request.target,
-            config_files
+            configs=snapshot_data.get("configs", {})
         )
         
         # Generate report
@@ -266,24 +507,17 @@ async def verify_reachability(request: ReachabilityRequest):
 @app.post("/verify-isolation")
 async def verify_isolation(request: IsolationRequest):
     try:
-        # Get the latest snapshot
-        snapshot_dir = Path("snapshots")
-        snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-        if not snapshots:
-            raise HTTPException(status_code=404, detail="No network configuration found")
-        latest_snapshot = snapshots[-1]
-        with open(latest_snapshot, "r") as f:
-            snapshot_data = json.load(f)
+        snapshot_data = _load_latest_snapshot()
         config_files = snapshot_data.get("files", [])
         if not config_files:
             raise HTTPException(status_code=404, detail="No configuration files found in snapshot")
         # Initialize verification engine
-        verification_engine = VerificationEngine(use_batfish=False)
+        verification_engine = _latest_engine()
         # Verify reachability
         result = verification_engine.verify_reachability(
             request.source,
             request.target,
-            config_files
+            configs=snapshot_data.get("configs", {})
         )
         # 逻辑反转：有路径为FAIL，无路径为PASS
         isolated = not result["reachable"]
@@ -316,18 +550,8 @@ async def verify_isolation(request: IsolationRequest):
 
 @app.get("/snapshots")
 async def list_snapshots():
-    snapshot_dir = Path("snapshots")
-    snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-    snapshot_list = []
-    for snap in snapshots:
-        with open(snap, "r") as f:
-            data = json.load(f)
-        snapshot_list.append({
-            "id": snap.stem,  # e.g. snapshot_20240505_123456
-            "timestamp": data.get("timestamp", ""),
-            "files": data.get("files", [])
-        })
-    return {"snapshots": snapshot_list}
+    async with _index_lock:
+        return {"snapshots": list(_load_index())}
 
 @app.get("/load-snapshot/{snapshot_id}")
 async def load_snapshot(snapshot_id: str):
@@ -335,35 +559,10 @@ async def load_snapshot(snapshot_id: str):
         snapshot_path = Path("snapshots") / f"{snapshot_id}.json"
         if not snapshot_path.exists():
             raise HTTPException(status_code=404, detail="Snapshot not found")
-        with open(snapshot_path, "r") as f:
-            snapshot_data = json.load(f)
-        configs = snapshot_data.get("configs", {})
-        # Build topology
-        topology_builder = TopologyBuilder()
-        topology = topology_builder.build_topology(configs)
-        formatted_topology = {
-            "nodes": [
-                {
-                    "id": node["id"],
-                    "label": node["label"],
-                    "title": node["title"],
-                    "group": node["group"],
-                    "value": node["value"]
-                }
-                for node in topology["nodes"]
-            ],
-            "edges": [
-                {
-                    "id": edge["id"],
-                    "from": edge["from"],
-                    "to": edge["to"],
-                    "label": edge["label"],
-                    "title": edge["title"]
-                }
-                for edge in topology["edges"]
-            ]
-        }
-        return {"status": "success", "topology": formatted_topology}
+        # Serve the cached pre-serialized payload; the projection and the
+        # JSON encode both run at most once per snapshot version
+        payload = _load_snapshot_payload(snapshot_id, snapshot_path.stat().st_mtime)
+        return Response(payload, media_type="application/json")
     except Exception as e:
         logger.error(f"Error loading snapshot: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -371,24 +570,17 @@ async def load_snapshot(snapshot_id: str):
 @app.post("/locate-path")
 async def locate_path(request: PathLocateRequest):
     try:
-        # Get the latest snapshot
-        snapshot_dir = Path("snapshots")
-        snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-        if not snapshots:
-            raise HTTPException(status_code=404, detail="No network configuration found")
-        latest_snapshot = snapshots[-1]
-        with open(latest_snapshot, "r") as f:
-            snapshot_data = json.load(f)
+        snapshot_data = _load_latest_snapshot()
         config_files = snapshot_data.get("files", [])
         if not config_files:
             raise HTTPException(status_code=404, detail="No configuration files found in snapshot")
         # Initialize verification engine
-        verification_engine = VerificationEngine(use_batfish=False)
+        verification_engine = _latest_engine()
         # 查找所有路径
         result = verification_engine.find_all_paths(
             request.source,
             request.target,
-            config_files
+            configs=snapshot_data.get("configs", {})
         )
         return {
             "status": "success",
@@ -404,24 +596,17 @@ async def locate_path(request: PathLocateRequest):
 @app.post("/verify-disjoint-paths")
 async def verify_disjoint_paths(request: DisjointPathRequest):
     try:
-        # Get the latest snapshot
-        snapshot_dir = Path("snapshots")
-        snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-        if not snapshots:
-            raise HTTPException(status_code=404, detail="No network configuration found")
-        latest_snapshot = snapshots[-1]
-        with open(latest_snapshot, "r") as f:
-            snapshot_data = json.load(f)
+        snapshot_data = _load_latest_snapshot()
         config_files = snapshot_data.get("files", [])
         if not config_files:
             raise HTTPException(status_code=404, detail="No configuration files found in snapshot")
-        verification_engine = VerificationEngine(use_batfish=False)
+        verification_engine = _latest_engine()
         result = verification_engine.find_disjoint_paths(
             request.source,
             request.target,
-            config_files,
             mode=request.mode,
-            max_paths=2
+            max_paths=2,
+            configs=snapshot_data.get("configs", {})
         )
         return {
             "status": "success",
@@ -437,15 +622,9 @@ async def verify_disjoint_paths(request: DisjointPathRequest):
 @app.post("/verify-forwarding-loops")
 async def verify_forwarding_loops(request: LoopDetectionRequest):
     try:
-        snapshot_dir = Path("snapshots")
-        snapshots = sorted(snapshot_dir.glob("snapshot_*.json"), key=lambda x: x.stat().st_mtime)
-        if not snapshots:
-            raise HTTPException(status_code=404, detail="No network configuration found")
-        latest_snapshot = snapshots[-1]
-        with open(latest_snapshot, "r") as f:
-            snapshot_data = json.load(f)
+        snapshot_data = _load_latest_snapshot()
         configs = snapshot_data.get("configs", {})
-        engine = VerificationEngine(use_batfish=False)
+        engine = _latest_engine()
         params = {"mode": request.mode, "node": request.node}
         result = engine.check_forwarding_loops(params, configs)
         return result
@@ -459,8 +638,7 @@ async def get_snapshot(snapshot_id: str):
     snapshot_path = Path("snapshots") / f"{snapshot_id}.json"
     if not snapshot_path.exists():
         raise HTTPException(status_code=404, detail="Snapshot not found")
-    with open(snapshot_path, "r") as f:
-        return json.load(f)
+    return _read_json(snapshot_path)
 
 @app.delete("/snapshot/{snapshot_id}")
 async def delete_snapshot(snapshot_id: str, file: Optional[str] = Body(default=None)):
@@ -471,19 +649,32 @@ async def delete_snapshot(snapshot_id: str, file: Optional[str] = Body(default=N
     if file:
         # 删除快照中的单个文件
         try:
-            with open(snapshot_path, "r") as f:
-                data = json.load(f)
-            files = data.get("files", [])
-            configs = data.get("configs", {})
-            # 支持完整路径和短文件名
-            short_file = file.split("/")[-1]
-            files = [f for f in files if f != file and f.split("/")[-1] != short_file]
-            configs.pop(file, None)
-            configs.pop(short_file, None)
-            data["files"] = files
-            data["configs"] = configs
-            with open(snapshot_path, "w") as f:
-                json.dump(data, f, indent=2)
+            def _rewrite_without_file():
+                data = _read_json(snapshot_path)
+                files = data.get("files", [])
+                configs = data.get("configs", {})
+                # 支持完整路径和短文件名
+                short_file = file.split("/")[-1]
+                files = [f for f in files if f != file and f.split("/")[-1] != short_file]
+                configs.pop(file, None)
+                configs.pop(short_file, None)
+                data["files"] = files
+                data["configs"] = configs
+                # Write to a sibling temp file and rename so a crash
+                # mid-write can never leave a truncated snapshot behind
+                tmp = snapshot_path.with_name(snapshot_path.name + ".tmp")
+                tmp.write_bytes(_dumps(data))
+                os.replace(tmp, snapshot_path)
+                return files
+
+            files = await asyncio.to_thread(_rewrite_without_file)
+            async with _index_lock:
+                for entry in _load_index():
+                    if entry["id"] == snapshot_id:
+                        entry["files"] = files
+                _save_index()
+            _drop_snapshot_caches()
+            _invalidate_latest_snapshot()
             return {"status": "success", "message": f"File {file} deleted from snapshot {snapshot_id}."}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete file from snapshot: {str(e)}")
@@ -491,25 +682,41 @@ async def delete_snapshot(snapshot_id: str, file: Optional[str] = Body(default=N
         # 删除整个快照
         try:
             snapshot_path.unlink()
+            async with _index_lock:
+                global _snapshot_index
+                _snapshot_index = [e for e in _load_index() if e["id"] != snapshot_id]
+                _save_index()
+            _drop_snapshot_caches()
+            _invalidate_latest_snapshot()
             return {"status": "success", "message": f"Snapshot {snapshot_id} deleted."}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete snapshot: {str(e)}")
 
+def _batch_delete(paths: List[str]):
+    """Unlink many files in one thread hop; returns (deleted, errors)."""
+    deleted = []
+    errors = []
+    for path in paths:
+        try:
+            os.unlink(path)
+            deleted.append(Path(path).stem)
+        except OSError as e:
+            errors.append({"id": Path(path).stem, "error": str(e)})
+    return deleted, errors
+
 @app.get("/snapshots/batch/{timestamp}")
 async def get_snapshots_by_batch(timestamp: str):
     """查看同一批次（timestamp）下所有快照内容"""
-    snapshot_dir = Path("snapshots")
-    batch_files = list(snapshot_dir.glob(f"snapshot_{timestamp}*.json"))
-    if not batch_files:
+    batch_entries = [e for e in _load_index() if e["id"].startswith(f"snapshot_{timestamp}")]
+    if not batch_entries:
         raise HTTPException(status_code=404, detail="No snapshots found for this batch")
     batch_snapshots = []
-    for snap in batch_files:
-        with open(snap, "r") as f:
-            data = json.load(f)
+    for entry in batch_entries:
+        data = _read_json(Path("snapshots") / f"{entry['id']}.json")
         batch_snapshots.append({
-            "id": snap.stem,
-            "timestamp": data.get("timestamp", ""),
-            "files": data.get("files", []),
+            "id": entry["id"],
+            "timestamp": entry["timestamp"],
+            "files": entry["files"],
             "content": data
         })
     return {"snapshots": batch_snapshots}
@@ -517,16 +724,17 @@ async def get_snapshots_by_batch(timestamp: str):
 @app.delete("/snapshots/batch/{timestamp}")
 async def delete_snapshots_by_batch(timestamp: str):
     """批量删除同一批次（timestamp）下所有快照"""
-    snapshot_dir = Path("snapshots")
-    batch_files = list(snapshot_dir.glob(f"snapshot_{timestamp}*.json"))
-    if not batch_files:
+    batch_entries = [e for e in _load_index() if e["id"].startswith(f"snapshot_{timestamp}")]
+    if not batch_entries:
         raise HTTPException(status_code=404, detail="No snapshots found for this batch")
-    deleted = []
-    errors = []
-    for snap in batch_files:
-        try:
-            snap.unlink()
-            deleted.append(snap.stem)
-        except Exception as e:
-            errors.append({"id": snap.stem, "error": str(e)})
+    # Many metadata syscalls; run them in one worker-thread batch so the
+    # event loop never blocks
+    paths = [str(Path("snapshots") / f"{e['id']}.json") for e in batch_entries]
+    deleted, errors = await asyncio.to_thread(_batch_delete, paths)
+    async with _index_lock:
+        global _snapshot_index
+        _snapshot_index = [e for e in _load_index() if e["id"] not in deleted]
+        _save_index()
+    _drop_snapshot_caches()
+    _invalidate_latest_snapshot()
     return {"deleted": deleted, "errors": errors} 
\ No newline at end of file
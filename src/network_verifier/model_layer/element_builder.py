@@ -27,16 +27,19 @@ class ElementBuilder:
         Returns:
             Created Device object
         """
-        device_interfaces = []
-        for iface_config in interfaces:
-            interface = Interface(
-                name=iface_config.get('name', ''),
-                ip_address=iface_config.get('ip_address'),
-                subnet_mask=iface_config.get('subnet_mask'),
-                neighbor=iface_config.get('neighbor'),
-                neighbor_interface=iface_config.get('neighbor_interface')
+        # Positional construction in one comprehension; Interface is a
+        # NamedTuple so there is no per-field keyword dispatch
+        iface = Interface
+        device_interfaces = [
+            iface(
+                c.get('name', ''),
+                c.get('ip_address'),
+                c.get('subnet_mask'),
+                c.get('neighbor'),
+                c.get('neighbor_interface')
             )
-            device_interfaces.append(interface)
+            for c in interfaces
+        ]
         
         return Device(
             name=name,
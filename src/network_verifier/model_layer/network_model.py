@@ -2,7 +2,8 @@
 Network model implementation.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 
@@ -12,9 +13,13 @@ class DeviceType(Enum):
     SWITCH = "switch"
     FIREWALL = "firewall"
 
-@dataclass
-class Interface:
-    """Network interface representation."""
+class Interface(NamedTuple):
+    """Network interface representation.
+
+    A NamedTuple rather than a dataclass: instances are built in bulk
+    per device and never mutated, so the tuple layout avoids a per-
+    instance __dict__.
+    """
     name: str
     ip_address: Optional[str] = None
     subnet_mask: Optional[str] = None
@@ -35,7 +40,7 @@ class NetworkModel:
     def __init__(self):
         """Initialize the network model."""
         self.devices: Dict[str, Device] = {}
-        self.topology: Dict[str, List[str]] = {}
+        self.topology: Dict[str, List[str]] = defaultdict(list)
     
     def add_device(self, device: Device) -> None:
         """
@@ -45,12 +50,13 @@ class NetworkModel:
             device: Device to add
         """
         self.devices[device.name] = device
-        self.topology[device.name] = []
         
-        # Update topology with device connections
-        for interface in device.interfaces:
-            if interface.neighbor:
-                self.topology[device.name].append(interface.neighbor)
+        # One comprehension builds the device's connection list outright
+        self.topology[device.name] = [
+            interface.neighbor
+            for interface in device.interfaces
+            if interface.neighbor
+        ]
     
     def get_device(self, device_name: str) -> Optional[Device]:
         """
@@ -73,14 +79,15 @@ class NetworkModel:
         """
         return self.topology
     
-    def get_devices(self) -> List[Device]:
+    def get_devices(self) -> Iterable[Device]:
         """
         Get all devices in the network.
         
         Returns:
-            List of all devices
+            View over all devices; callers that need indexing can wrap
+            it in list() themselves
         """
-        return list(self.devices.values())
+        return self.devices.values()
     
     def get_device_interfaces(self, device_name: str) -> List[Interface]:
         """
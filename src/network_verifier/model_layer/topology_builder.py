@@ -3,20 +3,32 @@ Topology builder for network visualization.
 """
 
 from typing import Dict, List, Any
-import networkx as nx
+from collections import defaultdict
+import hashlib
 import json
 import logging
+import socket
+import struct
 
 logger = logging.getLogger(__name__)
 
+def _ip_int(s: str) -> int:
+    """Dotted-quad string to one unsigned int (C-level parse)."""
+    return struct.unpack('>I', socket.inet_aton(s))[0]
+
 class TopologyBuilder:
     """Builds network topology from configuration data."""
     
     def __init__(self):
-        self.graph = nx.Graph()
-        self.node_counter = 0
-        self.edge_counter = 0
+        # Plain containers: the graph was only ever filled and then read
+        # back out for vis.js, so nx's attribute storage was overhead
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[tuple, Dict[str, Any]] = {}
         self.configs = {}
+        # Last build memo: report generation, visualization and repeated
+        # engine queries all rebuild from the same configs
+        self._last_key = None
+        self._last_result = None
     
     def infer_group(self, device_name: str) -> str:
         name = device_name.lower()
@@ -45,16 +57,33 @@ class TopologyBuilder:
         # 自动为每个设备分配 group 字段
         for device_name, config in configs.items():
             config['group'] = self.infer_group(device_name)
+        # Serializing the configs for the memo key is a C-level pass,
+        # far cheaper than re-running the Python build loops below
+        try:
+            key = hashlib.blake2b(
+                json.dumps(configs, sort_keys=True).encode('utf-8'),
+                digest_size=16
+            ).digest()
+        except (TypeError, ValueError):
+            key = None
+        if key is not None and key == self._last_key:
+            return {
+                'nodes': list(self._last_result['nodes']),
+                'edges': list(self._last_result['edges'])
+            }
         self._reset()
         self.configs = configs
         self._process_configs(configs)
-        return self._format_for_visualization()
+        result = self._format_for_visualization()
+        if key is not None:
+            self._last_key = key
+            self._last_result = result
+        return result
     
     def _reset(self):
         """Reset the builder state."""
-        self.graph = nx.Graph()
-        self.node_counter = 0
-        self.edge_counter = 0
+        self._nodes = {}
+        self._edges = {}
     
     def _process_configs(self, configs: Dict[str, Any]):
         """Process configuration data and build the graph."""
@@ -62,47 +91,56 @@ class TopologyBuilder:
         for device_name, config in configs.items():
             self._add_device_node(device_name, config)
         
-        # Second pass: process interfaces and connections
+        # Second pass: explicit neighbor edges; interfaces without
+        # neighbor info are bucketed by network address so inferred
+        # links come from one grouped pass instead of an all-pairs scan
+        subnet_index = defaultdict(list)
         for device_name, config in configs.items():
             if 'interfaces' in config:
                 for interface in config['interfaces']:
-                    self._process_interface(device_name, interface)
+                    self._process_interface(device_name, interface, subnet_index)
+        self._link_subnet_buckets(subnet_index)
     
     def _add_device_node(self, device_name: str, config: Dict[str, Any]):
         """Add a device node to the graph."""
         try:
-            # Count interfaces and extract key information
-            interface_count = len(config.get('interfaces', []))
+            # Bind the interface list once; it feeds the count, the IP
+            # extraction and the title below
+            interfaces = config.get('interfaces') or []
+            interface_count = len(interfaces)
             ip_addresses = [
                 intf.get('ip_address')
-                for intf in config.get('interfaces', [])
+                for intf in interfaces
                 if intf.get('ip_address')
             ]
+            device_type = config.get('device_type', 'Unknown')
+            ip_str = ', '.join(ip_addresses) if ip_addresses else 'None'
             
-            # Build detailed device information
+            # Build detailed device information; one join builds the
+            # title without intermediate concatenations
             device_info = {
                 'id': device_name,  # Use device name as ID
                 'label': device_name,
-                'title': (
-                    f"Device: {device_name}\n"
-                    f"Type: {config.get('device_type', 'Unknown')}\n"
-                    f"Interfaces: {interface_count}\n"
-                    f"IP Addresses: {', '.join(ip_addresses) if ip_addresses else 'None'}"
-                ),
+                'title': '\n'.join((
+                    'Device: ' + device_name,
+                    'Type: ' + device_type,
+                    'Interfaces: ' + str(interface_count),
+                    'IP Addresses: ' + ip_str
+                )),
                 'group': config.get('group', 'Unknown'),
                 'value': interface_count
             }
             
-            self.graph.add_node(device_name, **device_info)
+            self._nodes[device_name] = device_info
             
         except Exception as e:
             logger.error(f"Error adding device node {device_name}: {str(e)}")
     
-    def _process_interface(self, device_name: str, interface: Dict[str, Any]) -> None:
+    def _process_interface(self, device_name: str, interface: Dict[str, Any], subnet_index: Dict[int, List]) -> None:
         """Process interface details and connections."""
+        interface_name = interface.get('name', '')
         try:
             # Extract interface information
-            interface_name = interface.get('name', '')
             ip_address = interface.get('ip_address', '')
             subnet_mask = interface.get('subnet_mask', '')
             neighbor = interface.get('neighbor', {})
@@ -110,13 +148,17 @@ class TopologyBuilder:
             # Add edge if neighbor information is available
             if neighbor and 'device' in neighbor:
                 neighbor_device = neighbor['device']
+                key = self._edge_key(device_name, neighbor_device)
+                if key in self._edges:
+                    return
                 neighbor_interface = neighbor.get('interface', '')
                 
                 # Create edge ID
                 edge_id = f"{device_name}_{interface_name}-{neighbor_device}_{neighbor_interface}"
                 
                 # Add edge to graph
-                self.graph.add_edge(
+                self._add_edge(
+                    key,
                     device_name,
                     neighbor_device,
                     id=edge_id,
@@ -124,85 +166,71 @@ class TopologyBuilder:
                     title=f"IP: {ip_address}\nNeighbor: {neighbor_device}"
                 )
                 
-            # If no neighbor info but has IP, try to find potential connections
+            # If no neighbor info but has IP, bucket by network address;
+            # interfaces landing in the same bucket share a subnet
             elif ip_address and subnet_mask:
-                # Look for other devices with interfaces in the same subnet
-                for other_device, other_config in self.configs.items():
-                    if other_device != device_name:
-                        for other_interface in other_config.get('interfaces', []):
-                            other_ip = other_interface.get('ip_address', '')
-                            other_mask = other_interface.get('subnet_mask', '')
-                            
-                            if other_ip and other_mask and self._is_same_subnet(ip_address, subnet_mask, other_ip, other_mask):
-                                # Create edge ID
-                                edge_id = f"{device_name}_{interface_name}-{other_device}_{other_interface['name']}"
-                                
-                                # Add edge to graph
-                                self.graph.add_edge(
-                                    device_name,
-                                    other_device,
-                                    id=edge_id,
-                                    label=f"{interface_name}-{other_interface['name']}",
-                                    title=f"IP: {ip_address}\nConnected to: {other_ip}"
-                                )
-                                
+                try:
+                    net = _ip_int(ip_address) & _ip_int(subnet_mask)
+                except OSError:
+                    return
+                subnet_index[net].append((device_name, interface_name, ip_address))
+                
         except Exception as e:
             logger.error(f"Error processing interface {interface_name} for device {device_name}: {str(e)}")
     
-    def _is_same_subnet(self, ip1: str, mask1: str, ip2: str, mask2: str) -> bool:
-        """Check if two IP addresses are in the same subnet."""
-        try:
-            # Convert IP and mask to integers
-            ip1_parts = [int(x) for x in ip1.split('.')]
-            mask1_parts = [int(x) for x in mask1.split('.')]
-            ip2_parts = [int(x) for x in ip2.split('.')]
-            mask2_parts = [int(x) for x in mask2.split('.')]
-            
-            # Calculate network addresses
-            net1 = [ip1_parts[i] & mask1_parts[i] for i in range(4)]
-            net2 = [ip2_parts[i] & mask2_parts[i] for i in range(4)]
-            
-            return net1 == net2
-        except:
-            return False
+    def _link_subnet_buckets(self, subnet_index: Dict[int, List]) -> None:
+        """Add an edge for every cross-device pair within a subnet bucket."""
+        for members in subnet_index.values():
+            if len(members) < 2:
+                continue
+            for i in range(len(members) - 1):
+                device_name, interface_name, ip_address = members[i]
+                for other_device, other_name, other_ip in members[i + 1:]:
+                    if other_device == device_name:
+                        continue
+                    key = self._edge_key(device_name, other_device)
+                    if key in self._edges:
+                        continue
+                    edge_id = f"{device_name}_{interface_name}-{other_device}_{other_name}"
+                    self._add_edge(
+                        key,
+                        device_name,
+                        other_device,
+                        id=edge_id,
+                        label=f"{interface_name}-{other_name}",
+                        title=f"IP: {ip_address}\nConnected to: {other_ip}"
+                    )
     
-    def _get_node_id(self, device_name: str) -> int:
-        """Get the node ID for a device name."""
-        for node_id, data in self.graph.nodes(data=True):
-            if data['label'] == device_name:
-                return node_id
-        return None
+    @staticmethod
+    def _edge_key(a: str, b: str) -> tuple:
+        """Canonical key for an undirected edge between two devices."""
+        return (a, b) if a <= b else (b, a)
+    
+    def _add_edge(self, key: tuple, device_name: str, neighbor_device: str, **attrs) -> None:
+        """Record a new undirected edge under its canonical key."""
+        self._ensure_node(device_name)
+        self._ensure_node(neighbor_device)
+        self._edges[key] = {
+            'id': attrs.get('id', f"{device_name}-{neighbor_device}"),
+            'from': device_name,
+            'to': neighbor_device,
+            'label': attrs.get('label', ''),
+            'title': attrs.get('title', '')
+        }
+    
+    def _ensure_node(self, device_name: str) -> None:
+        """Register a placeholder node for devices only seen as neighbors."""
+        if device_name not in self._nodes:
+            self._nodes[device_name] = {
+                'id': device_name,
+                'label': device_name,
+                'title': '',
+                'group': 'Unknown',
+                'value': 1
+            }
     
     def _format_for_visualization(self) -> Dict[str, List[Dict[str, Any]]]:
         """Format the graph data for visualization."""
-        try:
-            nodes = []
-            edges = []
-            
-            # Extract nodes
-            for node_id, data in self.graph.nodes(data=True):
-                node = {
-                    'id': node_id,
-                    'label': data.get('label', node_id),
-                    'title': data.get('title', ''),
-                    'group': data.get('group', 'Unknown'),
-                    'value': data.get('value', 1)
-                }
-                nodes.append(node)
-            
-            # Extract edges
-            for source, target, data in self.graph.edges(data=True):
-                edge = {
-                    'id': data.get('id', f"{source}-{target}"),
-                    'from': source,
-                    'to': target,
-                    'label': data.get('label', ''),
-                    'title': data.get('title', '')
-                }
-                edges.append(edge)
-            
-            return {'nodes': nodes, 'edges': edges}
-            
-        except Exception as e:
-            logger.error(f"Error formatting graph for visualization: {str(e)}")
-            return {'nodes': [], 'edges': []} 
\ No newline at end of file
+        # Nodes and edges are already stored in vis.js shape; hand back
+        # fresh lists so callers can't mutate builder state
+        return {'nodes': list(self._nodes.values()), 'edges': list(self._edges.values())} 
\ No newline at end of file
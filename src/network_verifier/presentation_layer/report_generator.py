@@ -2,15 +2,21 @@
 Report generator for network verification results.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
+from collections import Counter
 import json
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ReportGenerator:
     """Generates reports from verification results."""
     
-    def generate_report(self, results: Dict[str, Any], snapshot_name: str) -> str:
+    def generate_report(self, results: Dict[str, Any], snapshot_name: str) -> Tuple[str, Dict[str, Any]]:
         """
         Generate a report from verification results.
         
@@ -19,53 +25,66 @@ class ReportGenerator:
             snapshot_name: Name of the snapshot being verified
             
         Returns:
-            Path to the generated report
+            Tuple of (path to the generated report, report dict), so
+            callers can embed the report in a response without reading
+            the file back
         """
         try:
             # Create reports directory if it doesn't exist
             reports_dir = Path("reports")
             reports_dir.mkdir(exist_ok=True)
             
-            # Generate report filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Generate report filename; one clock read feeds both the
+            # filename and the metadata timestamp so they always agree
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             report_filename = f"report_{snapshot_name}_{timestamp}.json"
             report_path = reports_dir / report_filename
             
+            # Count check statuses in one pass instead of one full
+            # traversal per summary field
+            checks = results.get('checks', {}) or {}
+            status_counts = Counter(check.get('status') for check in checks.values())
+            
             # Add metadata and summary to report
             report = {
                 'metadata': {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'snapshot_name': snapshot_name,
                     'version': '1.0',
                     'report_id': f"REPORT_{timestamp}"
                 },
                 'summary': {
                     'overall_status': results.get('overall_status', 'UNKNOWN'),
-                    'total_checks': len(results.get('checks', {})),
-                    'passed_checks': sum(1 for check in results.get('checks', {}).values() 
-                                      if check.get('status') == 'PASSED'),
-                    'failed_checks': sum(1 for check in results.get('checks', {}).values() 
-                                      if check.get('status') == 'FAILED'),
-                    'error_checks': sum(1 for check in results.get('checks', {}).values() 
-                                      if check.get('status') == 'ERROR')
+                    'total_checks': len(checks),
+                    'passed_checks': status_counts.get('PASSED', 0),
+                    'failed_checks': status_counts.get('FAILED', 0),
+                    'error_checks': status_counts.get('ERROR', 0)
                 },
                 'results': results
             }
             
             # Add detailed analysis for each check
             report['analysis'] = {}
-            for check_name, check_data in results.get('checks', {}).items():
+            for check_name, check_data in checks.items():
                 report['analysis'][check_name] = {
                     'status': check_data.get('status', 'UNKNOWN'),
                     'description': check_data.get('description', ''),
                     'details': check_data.get('details', {})
                 }
             
-            # Write report to file
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2)
+            # Write report to file. Reports are read by humans, so the
+            # indentation stays; orjson's C encoder and raw UTF-8 output
+            # (no \uXXXX escaping of non-ASCII device names) still cut
+            # the serialization cost several-fold.
+            if orjson is not None:
+                with open(report_path, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(report_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
             
-            return str(report_path)
+            return str(report_path), report
             
         except Exception as e:
             raise Exception(f"Failed to generate report: {str(e)}")
@@ -120,93 +139,42 @@ class ReportGenerator:
         except Exception as e:
             return f"Error formatting report: {str(e)}"
     
-    def _analyze_reachability(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze reachability check results."""
-        check = results.get('checks', {}).get('reachability', {})
-        if not check:
-            return None
-            
-        return {
-            'status': check.get('status'),
-            'details': {
-                'valid_ips': check.get('details', {}).get('valid_ips'),
-                'interface_count': check.get('details', {}).get('interface_count'),
-                'recommendation': (
-                    "All IP addresses are valid and interfaces are properly configured."
-                    if check.get('status') == 'PASSED'
-                    else "Review interface IP configurations for potential issues."
-                )
-            }
-        }
-    
-    def _analyze_isolation(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze isolation check results."""
-        check = results.get('checks', {}).get('isolation', {})
-        if not check:
-            return None
-            
-        return {
-            'status': check.get('status'),
-            'details': {
-                'subnet_conflicts': check.get('details', {}).get('subnet_conflicts', []),
-                'recommendation': (
-                    "Network segments are properly isolated."
-                    if check.get('status') == 'PASSED'
-                    else "Review subnet configurations to resolve conflicts."
-                )
-            }
-        }
-    
-    def _analyze_bgp_peering(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze BGP peering check results."""
-        check = results.get('checks', {}).get('bgp_peering', {})
-        if not check:
-            return None
-            
-        return {
-            'status': check.get('status'),
-            'details': {
-                'devices_with_bgp': check.get('details', {}).get('devices_with_bgp', []),
-                'recommendation': (
-                    "BGP configurations are properly set up."
-                    if check.get('status') == 'PASSED'
-                    else "Review BGP configurations for potential issues."
-                )
-            }
-        }
-    
-    def _analyze_acl_consistency(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze ACL consistency check results."""
-        check = results.get('checks', {}).get('acl_consistency', {})
+    # Per-check analysis table: (check name, (detail key, default) pairs,
+    # recommendation on pass, recommendation on anything else). One data
+    # row per check replaces five structurally identical methods.
+    ANALYSES = (
+        ('reachability', (('valid_ips', None), ('interface_count', None)),
+         'All IP addresses are valid and interfaces are properly configured.',
+         'Review interface IP configurations for potential issues.'),
+        ('isolation', (('subnet_conflicts', []),),
+         'Network segments are properly isolated.',
+         'Review subnet configurations to resolve conflicts.'),
+        ('bgp_peering', (('devices_with_bgp', []),),
+         'BGP configurations are properly set up.',
+         'Review BGP configurations for potential issues.'),
+        ('acl_consistency', (('devices_with_acl', []),),
+         'ACL configurations are consistent across devices.',
+         'Review ACL configurations for consistency issues.'),
+        ('route_table', (('devices_with_routes', []),),
+         'Routing configurations are properly set up.',
+         'Review routing configurations for potential issues.'),
+    )
+
+    def _analyze(self, results: Dict[str, Any], name: str, keys, ok_msg: str, fail_msg: str) -> Dict[str, Any]:
+        """Analyze one check per its ANALYSES row."""
+        check = results.get('checks', {}).get(name, {})
         if not check:
             return None
-            
+
+        status = check.get('status')
+        details = check.get('details', {})
+        analyzed = {key: details.get(key, default) for key, default in keys}
+        analyzed['recommendation'] = ok_msg if status == 'PASSED' else fail_msg
+        return {'status': status, 'details': analyzed}
+
+    def analyze_checks(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Run every ANALYSES row against the results."""
         return {
-            'status': check.get('status'),
-            'details': {
-                'devices_with_acl': check.get('details', {}).get('devices_with_acl', []),
-                'recommendation': (
-                    "ACL configurations are consistent across devices."
-                    if check.get('status') == 'PASSED'
-                    else "Review ACL configurations for consistency issues."
-                )
-            }
+            name: self._analyze(results, name, keys, ok_msg, fail_msg)
+            for name, keys, ok_msg, fail_msg in self.ANALYSES
         }
-    
-    def _analyze_route_table(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze route table check results."""
-        check = results.get('checks', {}).get('route_table', {})
-        if not check:
-            return None
-            
-        return {
-            'status': check.get('status'),
-            'details': {
-                'devices_with_routes': check.get('details', {}).get('devices_with_routes', []),
-                'recommendation': (
-                    "Routing configurations are properly set up."
-                    if check.get('status') == 'PASSED'
-                    else "Review routing configurations for potential issues."
-                )
-            }
-        } 
\ No newline at end of file
@@ -3,9 +3,13 @@ Network visualization module.
 """
 
 import json
+import math
 import os
 from typing import Dict, Any
 import networkx as nx
+import matplotlib
+# Headless backend: skips GUI toolkit initialization on servers
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 class NetworkVisualizer:
@@ -41,16 +45,26 @@ class NetworkVisualizer:
                     if "neighbor" in interface:
                         G.add_edge(device_name, interface["neighbor"])
             
-            # Draw the graph
-            plt.figure(figsize=(12, 8))
-            pos = nx.spring_layout(G)
-            nx.draw(G, pos, with_labels=True, node_color='lightblue', 
+            # Draw the graph. Spring layout is iterative and dominates
+            # render time as the graph grows, so cap its iterations and
+            # fall back to the O(V) circular layout on large topologies.
+            # An explicit figure keeps pyplot's global state-machine from
+            # accumulating figures across repeated calls.
+            fig, ax = plt.subplots(figsize=(12, 8))
+            n = G.number_of_nodes()
+            if n > 200:
+                pos = nx.circular_layout(G)
+            elif n:
+                pos = nx.spring_layout(G, iterations=30, seed=42, k=1 / math.sqrt(n))
+            else:
+                pos = {}
+            nx.draw(G, pos, ax=ax, with_labels=True, node_color='lightblue', 
                    node_size=2000, font_size=10, font_weight='bold')
             
             # Save the image
             output_path = os.path.join(self.output_dir, output_file)
-            plt.savefig(output_path)
-            plt.close()
+            fig.savefig(output_path)
+            plt.close(fig)
             
             return output_path
             
@@ -73,16 +87,16 @@ class NetworkVisualizer:
             checks = list(results["checks"].keys())
             statuses = [results["checks"][check]["status"] for check in checks]
             
-            plt.figure(figsize=(12, 6))
-            plt.bar(checks, [1 if s == "PASSED" else 0 for s in statuses])
-            plt.title("Verification Results")
-            plt.xticks(rotation=45)
-            plt.yticks([0, 1], ["FAILED", "PASSED"])
+            fig, ax = plt.subplots(figsize=(12, 6))
+            ax.bar(checks, [1 if s == "PASSED" else 0 for s in statuses])
+            ax.set_title("Verification Results")
+            ax.tick_params(axis='x', rotation=45)
+            ax.set_yticks([0, 1], labels=["FAILED", "PASSED"])
             
             # Save the image
             output_path = os.path.join(self.output_dir, output_file)
-            plt.savefig(output_path)
-            plt.close()
+            fig.savefig(output_path)
+            plt.close(fig)
             
             return output_path
             
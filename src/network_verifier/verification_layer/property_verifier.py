@@ -2,22 +2,189 @@
 Property verifier for network control plane properties.
 """
 
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Dict, List, Optional, Union
+
+import numpy as np
 from batfish.client.session import Session
 from batfish.datamodel import *
 from batfish.question import bfq
-from ..config import settings
+from ..config import get_settings
+
+class _RecordsView:
+    """
+    Lazy row-dict view over an answer frame.
+
+    Iteration zips the cached column names against itertuples rows, so
+    no intermediate list of per-row dicts is materialized up front;
+    len() and list() behave like the eager to_dict('records') output.
+    """
+    __slots__ = ('_frame', '_columns')
+
+    def __init__(self, frame):
+        self._frame = frame
+        self._columns = list(frame.columns)
+
+    def __iter__(self):
+        columns = self._columns
+        for row in self._frame.itertuples(index=False, name=None):
+            yield dict(zip(columns, row))
+
+    def __len__(self):
+        return len(self._frame)
+
+def _to_records_lazy(frame):
+    """Row dicts of an answer frame, built one at a time on iteration."""
+    return _RecordsView(frame) if not frame.empty else []
+
+@lru_cache(maxsize=512)
+def _path_constraints(source: str, destination: str) -> PathConstraints:
+    """Shared PathConstraints for a (source, destination) pair."""
+    return PathConstraints(startLocation=source, endLocation=destination)
+
+@lru_cache(maxsize=512)
+def _header_constraints(protocol: str = None, dst_ports: tuple = None,
+                        dst_ips: str = None) -> HeaderConstraints:
+    """Shared HeaderConstraints; dst_ports must be a tuple to be hashable."""
+    return HeaderConstraints(
+        protocols=protocol,
+        dstPorts=list(dst_ports) if dst_ports else None,
+        dstIps=dst_ips
+    )
+
+@lru_cache(maxsize=1)
+def _get_session() -> Session:
+    """Return the process-wide Batfish session, connecting once."""
+    settings = get_settings()
+    return Session(
+        host=settings.batfish_host,
+        port=settings.batfish_port
+    )
 
 class PropertyVerifier:
     """Handles verification of network control plane properties."""
-    
+
     def __init__(self):
-        self.session = Session(
-            host=settings.batfish_host,
-            port=settings.batfish_port
+        settings = get_settings()
+        self.session = _get_session()
+        # Workers overlap independent queries over the shared keep-alive
+        # connection; the lock serializes set_snapshot + answer because
+        # the session's snapshot pointer is shared mutable state.
+        self._pool = ThreadPoolExecutor(max_workers=settings.bf_workers)
+        self._session_lock = threading.Lock()
+        # Answer frames keyed by (snapshot, query name, parameter tuple);
+        # a repeated verification is then a dict hit instead of another
+        # Batfish round trip.
+        self._answer_cache = {}
+        self._current_snapshot = None
+
+    def _set_snapshot(self, snapshot_name: str):
+        """Point the session at a snapshot, skipping redundant switches."""
+        if snapshot_name != self._current_snapshot:
+            self.session.set_snapshot(snapshot_name)
+            self._current_snapshot = snapshot_name
+
+    def _cached_answer(self, snapshot_name: str, query_name: str, params: tuple, build):
+        """
+        Return the answer frame for a query, caching per query signature.
+
+        Args:
+            snapshot_name: Name of the snapshot the query runs against
+            query_name: Batfish question name used in the cache key
+            params: Hashable tuple of the query's distinguishing parameters
+            build: Zero-argument callable constructing the bfq question
+
+        Returns:
+            The answer DataFrame for the query
+        """
+        key = (snapshot_name, query_name, params)
+        frame = self._answer_cache.get(key)
+        if frame is None:
+            with self._session_lock:
+                self._set_snapshot(snapshot_name)
+                frame = build().answer().frame()
+            # Location columns repeat a small set of router names, so
+            # categorical codes let the later groupby compare small
+            # ints instead of hashing strings per row
+            for column in ('Start_Location', 'End_Location', 'Node'):
+                if column in frame.columns:
+                    frame[column] = frame[column].astype('category')
+            self._answer_cache[key] = frame
+        return frame
+
+    def _finalize(self, result, empty_status: str, present_status: str, key: str) -> Dict:
+        """Standard epilogue: one empty test drives both status and records."""
+        if result.empty:
+            return {'status': empty_status, key: []}
+        return {'status': present_status, key: _to_records_lazy(result)}
+
+    def verify_snapshot_properties(self, snapshot_name: str,
+                                   source: str,
+                                   destination: str) -> Dict:
+        """
+        Run the snapshot-wide property checks concurrently.
+
+        Args:
+            snapshot_name: Name of the snapshot to verify
+            source: Source IP address or interface
+            destination: Destination IP address or interface
+
+        Returns:
+            Dictionary mapping property name to its verification result
+        """
+        # Each check blocks on a Batfish round trip; submitting them
+        # together overlaps the waits on the shared session.
+        futures = {
+            'reachability': self._pool.submit(
+                self.verify_reachability, snapshot_name, source, destination),
+            'isolation': self._pool.submit(
+                self.verify_isolation, snapshot_name, source, destination),
+            'forwarding_loops': self._pool.submit(
+                self.verify_forwarding_loops, snapshot_name),
+            'bgp_peering': self._pool.submit(
+                self.verify_bgp_peering, snapshot_name),
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+    async def verify_snapshot_properties_async(self, snapshot_name: str,
+                                               source: str,
+                                               destination: str) -> Dict:
+        """
+        Async counterpart of verify_snapshot_properties.
+
+        The blocking pybatfish calls run on the verifier's pool and are
+        awaited together, so an async caller (e.g. a FastAPI handler)
+        overlaps the round trips without tying up the event loop.
+
+        Args:
+            snapshot_name: Name of the snapshot to verify
+            source: Source IP address or interface
+            destination: Destination IP address or interface
+
+        Returns:
+            Dictionary mapping property name to its verification result
+        """
+        loop = asyncio.get_running_loop()
+        checks = (
+            ('reachability', partial(
+                self.verify_reachability, snapshot_name, source, destination)),
+            ('isolation', partial(
+                self.verify_isolation, snapshot_name, source, destination)),
+            ('forwarding_loops', partial(
+                self.verify_forwarding_loops, snapshot_name)),
+            ('bgp_peering', partial(
+                self.verify_bgp_peering, snapshot_name)),
         )
-        
-    def verify_reachability(self, snapshot_name: str, 
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._pool, call) for _, call in checks)
+        )
+        return {name: result for (name, _), result in zip(checks, results)}
+
+    def verify_reachability(self, snapshot_name: str,
                           source: str, 
                           destination: str,
                           protocol: str = "tcp",
@@ -35,27 +202,65 @@ class PropertyVerifier:
         Returns:
             Dictionary containing reachability verification results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build reachability query
-        query = bfq.reachability(
-            pathConstraints=PathConstraints(
-                startLocation=source,
-                endLocation=destination
-            ),
-            headers=HeaderConstraints(
-                protocols=protocol,
-                dstPorts=dst_ports if dst_ports else None
+        ports_key = tuple(dst_ports) if dst_ports else None
+        result = self._cached_answer(
+            snapshot_name, 'reachability', (source, destination, protocol, ports_key),
+            lambda: bfq.reachability(
+                pathConstraints=_path_constraints(source, destination),
+                headers=_header_constraints(protocol, ports_key)
             )
         )
-        
-        # Execute verification
-        result = query.answer().frame()
+        return self._finalize(result, 'unreachable', 'reachable', 'paths')
+
+    def verify_reachability_batch(self, snapshot_name: str,
+                                  pairs: List[tuple],
+                                  protocol: str = "tcp",
+                                  dst_ports: List[int] = None) -> Dict:
+        """
+        Verify reachability for many (source, destination) pairs at once.
+
+        One union query replaces a round trip per pair; the single
+        answer frame is then split back out per pair.
+
+        Args:
+            snapshot_name: Name of the snapshot to verify
+            pairs: List of (source, destination) tuples
+            protocol: Protocol to test (tcp, udp, icmp)
+            dst_ports: List of destination ports to test
+
+        Returns:
+            Dictionary mapping each (source, destination) pair to its
+            reachability result
+        """
+        if not pairs:
+            return {}
+        # Batfish location specifiers accept |-separated unions, so all
+        # pairs fit in one pathConstraints.
+        sources = '|'.join(sorted({src for src, _ in pairs}))
+        destinations = '|'.join(sorted({dst for _, dst in pairs}))
+        ports_key = tuple(dst_ports) if dst_ports else None
+        result = self._cached_answer(
+            snapshot_name, 'reachability', (sources, destinations, protocol, ports_key),
+            lambda: bfq.reachability(
+                pathConstraints=_path_constraints(sources, destinations),
+                headers=_header_constraints(protocol, ports_key)
+            )
+        )
+        grouped = {}
+        if not result.empty:
+            grouped = {
+                key: group.to_dict('records')
+                for key, group in result.groupby(
+                    ['Start_Location', 'End_Location'], sort=False)
+            }
         return {
-            'status': 'reachable' if not result.empty else 'unreachable',
-            'paths': result.to_dict('records') if not result.empty else []
+            (source, destination): {
+                'status': 'reachable' if grouped.get((source, destination)) else 'unreachable',
+                'paths': grouped.get((source, destination), [])
+            }
+            for source, destination in pairs
         }
-    
+
     def verify_isolation(self, snapshot_name: str,
                         source: str,
                         destination: str) -> Dict:
@@ -70,23 +275,14 @@ class PropertyVerifier:
         Returns:
             Dictionary containing isolation verification results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build isolation query
-        query = bfq.reachability(
-            pathConstraints=PathConstraints(
-                startLocation=source,
-                endLocation=destination
-            ),
-            actions=FlowDisposition.DENIED_IN
+        result = self._cached_answer(
+            snapshot_name, 'reachability_denied', (source, destination),
+            lambda: bfq.reachability(
+                pathConstraints=_path_constraints(source, destination),
+                actions=FlowDisposition.DENIED_IN
+            )
         )
-        
-        # Execute verification
-        result = query.answer().frame()
-        return {
-            'status': 'isolated' if result.empty else 'not_isolated',
-            'violations': result.to_dict('records') if not result.empty else []
-        }
+        return self._finalize(result, 'isolated', 'not_isolated', 'violations')
     
     def verify_path_trace(self, snapshot_name: str,
                          source: str,
@@ -102,21 +298,17 @@ class PropertyVerifier:
         Returns:
             Dictionary containing path trace results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build path trace query
-        query = bfq.traceroute(
-            startLocation=source,
-            headers=HeaderConstraints(
-                dstIps=destination
+        result = self._cached_answer(
+            snapshot_name, 'traceroute', (source, destination),
+            lambda: bfq.traceroute(
+                startLocation=source,
+                headers=_header_constraints(dst_ips=destination)
             )
         )
-        
-        # Execute verification
-        result = query.answer().frame()
+        paths = _to_records_lazy(result)
         return {
-            'paths': result.to_dict('records') if not result.empty else [],
-            'path_count': len(result) if not result.empty else 0
+            'paths': paths,
+            'path_count': len(paths)
         }
     
     def verify_disjoint_paths(self, snapshot_name: str,
@@ -133,24 +325,18 @@ class PropertyVerifier:
         Returns:
             Dictionary containing disjoint paths verification results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build disjoint paths query
-        query = bfq.reachability(
-            pathConstraints=PathConstraints(
-                startLocation=source,
-                endLocation=destination
-            ),
-            actions=FlowDisposition.ACCEPTED
+        result = self._cached_answer(
+            snapshot_name, 'reachability_accepted', (source, destination),
+            lambda: bfq.reachability(
+                pathConstraints=_path_constraints(source, destination),
+                actions=FlowDisposition.ACCEPTED
+            )
         )
-        
-        # Execute verification
-        result = query.answer().frame()
-        paths = result.to_dict('records') if not result.empty else []
-        
-        # Analyze paths for disjointness
-        disjoint_paths = self._analyze_disjoint_paths(paths)
-        
+        # Analyze the frame directly; records materialize once for the
+        # response below
+        disjoint_paths = self._analyze_disjoint_paths(result)
+        paths = _to_records_lazy(result)
+
         return {
             'path_count': len(paths),
             'disjoint_paths': disjoint_paths,
@@ -167,16 +353,12 @@ class PropertyVerifier:
         Returns:
             Dictionary containing forwarding loop verification results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build forwarding loop query
-        query = bfq.detectLoops()
-        
-        # Execute verification
-        result = query.answer().frame()
+        result = self._cached_answer(
+            snapshot_name, 'detectLoops', (), lambda: bfq.detectLoops()
+        )
         return {
             'has_loops': not result.empty,
-            'loops': result.to_dict('records') if not result.empty else []
+            'loops': _to_records_lazy(result)
         }
     
     def verify_bgp_peering(self, snapshot_name: str) -> Dict:
@@ -189,66 +371,61 @@ class PropertyVerifier:
         Returns:
             Dictionary containing BGP peering verification results
         """
-        self.session.set_snapshot(snapshot_name)
-        
-        # Build BGP peering query
-        query = bfq.bgpSessionStatus()
-        
-        # Execute verification
-        result = query.answer().frame()
+        result = self._cached_answer(
+            snapshot_name, 'bgpSessionStatus', (), lambda: bfq.bgpSessionStatus()
+        )
+        # Boolean reduction instead of materializing the filtered frame
+        # just to take its length
+        established = 0
+        if not result.empty:
+            established = int((result['Established_Status'] == 'ESTABLISHED').sum())
         return {
-            'peering_status': result.to_dict('records') if not result.empty else [],
-            'established_count': len(result[result['Established_Status'] == 'ESTABLISHED']) if not result.empty else 0
+            'peering_status': _to_records_lazy(result),
+            'established_count': established
         }
     
-    def _analyze_disjoint_paths(self, paths: List[Dict]) -> List[List[Dict]]:
+    def _analyze_disjoint_paths(self, result) -> List[List[Dict]]:
         """
-        Analyze paths to identify disjoint paths.
-        
+        Analyze an answer frame to identify disjoint paths.
+
         Args:
-            paths: List of path dictionaries
-            
+            result: Answer DataFrame of accepted paths
+
         Returns:
             List of lists containing disjoint paths
         """
-        if not paths:
+        if result.empty:
             return []
-            
-        # Group paths by source and destination
-        path_groups = {}
-        for path in paths:
-            key = (path['Start_Location'], path['End_Location'])
-            if key not in path_groups:
-                path_groups[key] = []
-            path_groups[key].append(path)
-        
-        # Find disjoint paths within each group
+
+        # pandas does the (source, destination) grouping in one
+        # vectorized pass instead of a Python dict-building loop.
+        # Greedy single pass per group: a candidate is admitted iff it
+        # shares no node with the paths already taken. Node names are
+        # mapped to dense ids so membership lives in uint64 bitset
+        # words and the overlap test is one vectorized AND
         disjoint_paths = []
-        for group in path_groups.values():
+        intern = sys.intern
+        for _, group in result.groupby(['Start_Location', 'End_Location'], sort=False):
             if len(group) > 1:
-                # Simple check for disjointness based on intermediate nodes
-                # This is a simplified version - actual implementation would need
-                # more sophisticated path comparison
+                records = group.to_dict('records')
+                node_ids = {}
+                get_id = node_ids.setdefault
+                id_lists = [
+                    [get_id(intern(node) if type(node) is str else node, len(node_ids))
+                     for node in record.get('Nodes', ())]
+                    for record in records
+                ]
+                words = max(1, (len(node_ids) + 63) >> 6)
+                used_bits = np.zeros(words, dtype=np.uint64)
                 disjoint = []
-                for path in group:
-                    if not any(self._paths_share_nodes(path, p) for p in disjoint):
-                        disjoint.append(path)
+                for record, ids in zip(records, id_lists):
+                    bits = np.zeros(words, dtype=np.uint64)
+                    for i in ids:
+                        bits[i >> 6] |= np.uint64(1 << (i & 63))
+                    if not np.any(bits & used_bits):
+                        disjoint.append(record)
+                        used_bits |= bits
                 if len(disjoint) > 1:
                     disjoint_paths.append(disjoint)
-        
-        return disjoint_paths
-    
-    def _paths_share_nodes(self, path1: Dict, path2: Dict) -> bool:
-        """
-        Check if two paths share any intermediate nodes.
-        
-        Args:
-            path1: First path dictionary
-            path2: Second path dictionary
-            
-        Returns:
-            True if paths share nodes, False otherwise
-        """
-        nodes1 = set(path1.get('Nodes', []))
-        nodes2 = set(path2.get('Nodes', []))
-        return bool(nodes1.intersection(nodes2)) 
\ No newline at end of file
+
+        return disjoint_paths
\ No newline at end of file